@@ -0,0 +1,59 @@
+import chess
+import random
+import timeit
+
+from dynamic_difficulty_adjustment_chess import expand_positions
+
+######################################################################################
+# Benchmark for the move expansion used by get_all_evaluations()
+# Stockfish is not started here, only the cost of producing the positions to evaluate is measured
+######################################################################################
+benchmark_plies = [10, 80, 200]
+benchmark_repeats = 200
+# Positions with only a handful of replies would mostly measure the one-off legal move generation
+min_legal_moves = 20
+# Number of seeded random games tried before giving up on reaching a ply
+max_game_attempts = 1000
+
+
+def play_random_game(plies, seed=0):
+    # Replay random games until one reaches the wanted ply without ending, in a position with enough legal moves
+    rng = random.Random(seed)
+    for attempt in range(max_game_attempts):
+        board = chess.Board()
+        while len(board.move_stack) < plies and not board.is_game_over(claim_draw=False):
+            board.push(rng.choice(list(board.legal_moves)))
+        if len(board.move_stack) == plies and board.legal_moves.count() >= min_legal_moves:
+            return board
+    raise ValueError(f"No random game reached ply {plies} with at least {min_legal_moves} legal moves")
+
+
+def expand_with_copies(board):
+    # The old expansion: a full board copy, including its move stack, for every legal move
+    for move in board.legal_moves:
+        board_copy = board.copy()
+        board_copy.push(move)
+
+
+def expand_with_push_pop(board):
+    for move, result in expand_positions(board, lambda position: None):
+        pass
+
+
+def benchmark(plies):
+    board = play_random_game(plies)
+    legal_move_count = board.legal_moves.count()
+    results = {}
+    for name, expand in (("copy", expand_with_copies), ("push/pop", expand_with_push_pop)):
+        seconds = min(timeit.repeat(lambda: expand(board), number=benchmark_repeats, repeat=5))
+        # Microseconds spent per expanded move
+        results[name] = seconds / (benchmark_repeats * legal_move_count) * 1e6
+    return legal_move_count, results
+
+
+if __name__ == "__main__":
+    print("Ply\tMoves\tcopy (us/move)\tpush/pop (us/move)")
+    print("---------------------------------------------------")
+    for plies in benchmark_plies:
+        legal_move_count, results = benchmark(plies)
+        print(f"{plies}\t{legal_move_count}\t{results['copy']:.2f}\t\t{results['push/pop']:.2f}")
@@ -453,32 +453,31 @@ def play_engine_turn(board):
     print_board(board, from_square, to_square)
 
 
-def get_all_evaluations(board):
-    if board.turn == chess.WHITE:
-        white_to_move = True
-    else:
-        white_to_move = False
+def expand_positions(board, evaluate_position):
+    # Push/pop every move on the board itself instead of copying it, so the cost per move doesn't grow with the game's move history
+    # The move stack is kept so that Stockfish still sees the game history and can score repetitions as draws
+    # The move is popped before each result is yielded, so the board is never left changed, even if the caller stops early
+    for move in list(board.legal_moves):
+        board.push(move)
+        try:
+            result = evaluate_position(board)
+        finally:
+            board.pop()
+        yield move, result
 
-    evaluations = {}
+def iter_evaluations(board):
+    # Flip the score once for the whole expansion so that it's always from white's point of view
+    score_sign = -1 if board.turn == chess.WHITE else 1
 
     with chess.engine.SimpleEngine.popen_uci(stockfish_path) as engine:
-        for move in board.legal_moves:
-            # Make the move on a copy of the board
-            board_copy = board.copy()
-            board_copy.push(move)
-
-            # Evaluate the position after the move
-            result = engine.analyse(board_copy, chess.engine.Limit(time=0.05))
-            # Convert the score to a numeric value
-            evaluations[move.uci()] = result["score"].relative.score(mate_score=2000)  
-            #Divide the score by 100 to make it closer to chess.com evaluation
-            evaluations[move.uci()] = evaluations[move.uci()]/100
-
-            #Make it so that the score is actually correct
-            if white_to_move:
-                evaluations[move.uci()] = -evaluations[move.uci()]
+        # Evaluate the position after each move
+        for move, result in expand_positions(board, lambda position: engine.analyse(position, chess.engine.Limit(time=0.05))):
+            # Convert the score to a numeric value and divide it by 100 to make it closer to chess.com evaluation
+            yield move.uci(), score_sign * result["score"].relative.score(mate_score=2000) / 100
+
+def get_all_evaluations(board):
     # Sort the evaluations by score in descending order
-    sorted_evaluations = sorted(evaluations.items(), key=lambda x: x[1], reverse=white_to_move)
+    sorted_evaluations = sorted(iter_evaluations(board), key=lambda x: x[1], reverse=board.turn == chess.WHITE)
 
     return sorted_evaluations
 